@@ -61,28 +61,23 @@ def upgrade() -> None:
 def downgrade() -> None:
     """
     Re-add building, floor, zone columns to all tables.
-    """
-    
-    # Cafeteria tables
-    op.add_column('cafeteria_tables', sa.Column('building', sa.String(100), nullable=True))
-    op.add_column('cafeteria_tables', sa.Column('floor', sa.String(50), nullable=True))
-    op.add_column('cafeteria_tables', sa.Column('zone', sa.String(50), nullable=True))
-    op.create_index('ix_cafeteria_tables_building_floor', 'cafeteria_tables', ['building', 'floor'])
     
-    # Parking slots
-    op.add_column('parking_slots', sa.Column('building', sa.String(100), nullable=True))
-    op.add_column('parking_slots', sa.Column('floor', sa.String(50), nullable=True))
-    op.add_column('parking_slots', sa.Column('zone', sa.String(50), nullable=True))
-    op.create_index('ix_parking_slots_building_floor', 'parking_slots', ['building', 'floor'])
+    IF NOT EXISTS keeps this safe on databases where the columns were
+    never dropped. Dropped values are not restored: nothing keeps a
+    copy of them, so there is nothing to backfill and the columns come
+    back NULL.
+    """
     
-    # Conference rooms
-    op.add_column('conference_rooms', sa.Column('building', sa.String(100), nullable=True))
-    op.add_column('conference_rooms', sa.Column('floor', sa.String(50), nullable=True))
-    op.add_column('conference_rooms', sa.Column('zone', sa.String(50), nullable=True))
-    op.create_index('ix_conference_rooms_building_floor', 'conference_rooms', ['building', 'floor'])
+    # Re-add columns first ...
+    for table in ('cafeteria_tables', 'parking_slots', 'conference_rooms', 'desks'):
+        op.execute(
+            f'ALTER TABLE {table} '
+            'ADD COLUMN IF NOT EXISTS building VARCHAR(100), '
+            'ADD COLUMN IF NOT EXISTS floor VARCHAR(50), '
+            'ADD COLUMN IF NOT EXISTS zone VARCHAR(50)'
+        )
     
-    # Desks
-    op.add_column('desks', sa.Column('building', sa.String(100), nullable=True))
-    op.add_column('desks', sa.Column('floor', sa.String(50), nullable=True))
-    op.add_column('desks', sa.Column('zone', sa.String(50), nullable=True))
-    op.create_index('ix_desks_building_floor', 'desks', ['building', 'floor'])
+    # ... and build the indexes last, so any backfill added between the two
+    # steps doesn't pay per-row index maintenance (one bulk build instead)
+    for table in ('cafeteria_tables', 'parking_slots', 'conference_rooms', 'desks'):
+        op.execute(f'CREATE INDEX IF NOT EXISTS ix_{table}_building_floor ON {table} (building, floor)')
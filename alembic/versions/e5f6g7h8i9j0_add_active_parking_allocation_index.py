@@ -0,0 +1,48 @@
+"""Add partial index for active parking allocations per user
+
+Revision ID: e5f6g7h8i9j0
+Revises: 439084bc84ea
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6g7h8i9j0'
+down_revision: Union[str, None] = '439084bc84ea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Index only the active allocations by user_code.
+    
+    Backs the "does this user already have a slot" lookup. Built
+    CONCURRENTLY so allocations keep working while it builds. A failed
+    concurrent build leaves an INVALID index behind that IF NOT EXISTS would
+    silently keep, so drop any such leftover first.
+    """
+    with op.get_context().autocommit_block():
+        invalid = op.get_bind().execute(sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = 'ix_parking_allocation_active_user' AND NOT i.indisvalid"
+        )).scalar()
+        if invalid:
+            op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_parking_allocation_active_user')
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_parking_allocation_active_user '
+            'ON parking_allocations (user_code) WHERE is_active'
+        )
+
+
+def downgrade() -> None:
+    """
+    Drop the partial index.
+    """
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_parking_allocation_active_user')
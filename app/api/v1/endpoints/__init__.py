@@ -1,11 +1,11 @@
 from . import (
     auth, users, parking,
     desks, cafeteria, food_orders, attendance, leave,
-    it_assets, it_requests, projects, search
+    it_assets, it_requests, projects, search, batch
 )
 
 __all__ = [
     "auth", "users", "parking",
     "desks", "cafeteria", "food_orders", "attendance", "leave",
-    "it_assets", "it_requests", "projects", "search"
+    "it_assets", "it_requests", "projects", "search", "batch"
 ]
\ No newline at end of file
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime, timezone
 
 from ....core.database import get_db
 from ....core.dependencies import (
@@ -97,8 +97,6 @@ async def get_my_status(
     - total_hours: Total hours worked today
     - entries: List of all check-in/check-out entries
     """
-    from datetime import datetime, timezone
-    
     attendance_service = AttendanceService(db)
     today = datetime.now(timezone.utc).date()
     attendance = await attendance_service.get_user_attendance_for_date(
@@ -167,8 +165,6 @@ async def submit_today_for_approval(
     Automatically submits today's attendance for manager approval.
     Requires all check-ins to have corresponding check-outs.
     """
-    from datetime import datetime, timezone
-    
     attendance_service = AttendanceService(db)
     today = datetime.now(timezone.utc).date()
     attendance = await attendance_service.get_user_attendance_for_date(
@@ -9,6 +9,7 @@ from ....schemas.auth import (
     TokenRefreshResponse, PasswordChangeRequest
 )
 from ....schemas.base import APIResponse
+from ....schemas.user import UserResponse
 from ....services.auth_service import AuthService
 from ....utils.response import create_response
 
@@ -98,7 +99,6 @@ async def get_current_user_info(
     current_user: User = Depends(get_current_active_user)
 ):
     """Get current user information."""
-    from ....schemas.user import UserResponse
     return create_response(
         data=UserResponse.model_validate(current_user),
         message="User info retrieved"
@@ -0,0 +1,115 @@
+"""
+Batch - several API calls in one HTTP round-trip.
+
+Each sub-request is dispatched in-process through the full application
+(middleware, authentication, permission checks, its own DB session), exactly
+as if it had been sent on its own. Sub-requests run in order, so a later one
+may rely on an earlier one's side effects.
+
+Sub-requests inherit the caller's Authorization header unless they set one
+themselves, which lets a single batch probe the API as several users.
+Hop-by-hop and framing headers (Host, Content-Length, ...) are not forwarded.
+"""
+from urllib.parse import unquote
+
+import orjson
+import httpx
+from fastapi import APIRouter, Depends, Request
+
+from ....core.config import settings
+from ....core.dependencies import get_current_active_user
+from ....models.user import User
+from ....schemas.batch import BatchRequest, BatchResponse, BatchSubResponse
+from ....schemas.base import APIResponse
+from ....utils.response import create_response
+
+router = APIRouter()
+
+BATCH_PATH = f"{settings.API_V1_PREFIX}/batch"
+
+# Hop-by-hop and framing headers describe the outer connection/body; httpx
+# sets its own for each sub-request, so client-supplied ones are dropped
+DROPPED_HEADERS = frozenset({
+    "host", "content-length", "transfer-encoding", "connection",
+    "keep-alive", "te", "trailer", "upgrade", "proxy-connection",
+})
+
+
+def _check_path(path: str):
+    """Error message if a resolved sub-request path may not be dispatched."""
+    if not path.startswith(settings.API_V1_PREFIX + "/"):
+        return f"Sub-requests must target {settings.API_V1_PREFIX}"
+    if any(segment in (".", "..") for segment in path.split("/")):
+        return "Sub-request path must not contain relative segments"
+    if path.rstrip("/") == BATCH_PATH:
+        return "Nested batch requests are not allowed"
+    return None
+
+
+def _decode_body(response: httpx.Response):
+    """Sub-response body as JSON when possible, raw text otherwise."""
+    if not response.content:
+        return None
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return response.text
+
+
+@router.post("", response_model=APIResponse[BatchResponse])
+async def run_batch(
+    batch: BatchRequest,
+    request: Request,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    📦 Run up to 20 API calls in one request.
+    
+    Body: `{"requests": [{"method", "path", "headers", "body"}, ...]}`
+    
+    Returns `{"responses": [{"status", "body"}, ...]}` in the same order.
+    A failing sub-request does not stop the batch; check each `status`.
+    An unhandled error inside a sub-request is reported as status 500.
+    Nested batches and paths resolving outside the API prefix are rejected
+    with status 400.
+    """
+    authorization = request.headers.get("authorization")
+    responses = []
+    
+    transport = httpx.ASGITransport(app=request.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://batch") as client:
+        for sub in batch.requests:
+            path = sub.path
+            if not path.startswith(settings.API_V1_PREFIX + "/"):
+                path = f"{settings.API_V1_PREFIX}{path}"
+            
+            headers = {
+                k.lower(): v for k, v in sub.headers.items()
+                if k.lower() not in DROPPED_HEADERS
+            }
+            if authorization and "authorization" not in headers:
+                headers["authorization"] = authorization
+            
+            sub_request = client.build_request(
+                sub.method,
+                path,
+                headers=headers,
+                json=sub.body
+            )
+            
+            # Check the path the app will actually route, not the raw input
+            error = _check_path(unquote(sub_request.url.path))
+            if error:
+                responses.append(BatchSubResponse(status=400, body={"detail": error}))
+                continue
+            
+            response = await client.send(sub_request)
+            responses.append(BatchSubResponse(
+                status=response.status_code,
+                body=_decode_body(response)
+            ))
+    
+    return create_response(
+        data=BatchResponse(responses=responses),
+        message=f"Batch of {len(responses)} requests executed"
+    )
@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from typing import Optional, List
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 
 from ....core.database import get_db
 from ....core.dependencies import get_current_active_user, require_team_lead_or_above, require_manager_or_above
 from ....models.user import User
-from ....models.enums import LeaveType, LeaveStatus
+from ....models.enums import LeaveType, LeaveStatus, UserRole
 from ....models.leave import LeaveRequest
 from ....schemas.leave import (
     LeaveRequestCreate, LeaveRequestResponse, LeaveBalanceResponse, LeaveApproval
@@ -92,8 +93,6 @@ async def list_leave_requests(
     db: AsyncSession = Depends(get_db)
 ):
     """List leave requests."""
-    from ....models.enums import UserRole
-    
     # Non-managers can only see their own requests
     if current_user.role not in [UserRole.SUPER_ADMIN, UserRole.ADMIN, UserRole.MANAGER, UserRole.TEAM_LEAD]:
         user_id = current_user.id
@@ -239,8 +238,6 @@ async def get_my_leave_balance(
     db: AsyncSession = Depends(get_db)
 ):
     """Get current user's leave balance."""
-    from datetime import datetime
-    
     if year is None:
         year = datetime.now().year
     
@@ -279,16 +276,12 @@ async def get_user_leave_balance(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a user's leave balance. Manager+ required."""
-    from datetime import datetime
-    from sqlalchemy import select
-    from ....models.user import User as UserModel
-    
     if year is None:
         year = datetime.now().year
     
     # Lookup user by UUID to get user_code
     user_result = await db.execute(
-        select(UserModel).where(UserModel.id == user_id)
+        select(User).where(User.id == user_id)
     )
     target_user = user_result.scalar_one_or_none()
     if not target_user:
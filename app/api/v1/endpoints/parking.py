@@ -9,39 +9,77 @@ Simple Operations:
 - POST /parking/allocate - Get a parking slot (auto-assigns)
 - POST /parking/release - Release your parking slot
 - GET /parking/my-slot - Check your current parking status
+- GET /parking/logs/export - Full parking history as NDJSON (Admin only)
 """
 from typing import Optional
+from operator import attrgetter
 from uuid import UUID
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select, func, true
 
-from app.core.database import get_db
+from app.core.database import get_db, get_session_factory
 from app.api.v1.deps import get_current_user
 from app.models.user import User
 from app.models.parking import ParkingSlot, ParkingAllocation
 from app.models.enums import ManagerType, UserRole, ParkingType, VehicleType, ParkingSlotStatus
 from app.services.parking_service import ParkingService
-from app.utils.response import create_response
+from app.utils.response import create_response, create_serialized_response, etag_matches
 from app.schemas.base import APIResponse
 
 router = APIRouter()
 
+EXPORT_BATCH_SIZE = 500
+
+# Allocation attributes read for every parking log row, fetched in one call
+_LOG_ATTRS = attrgetter(
+    "id", "slot", "user", "user_code", "visitor_name", "vehicle_number",
+    "entry_time", "exit_time", "is_active"
+)
+
+
+def _log_entry(alloc_id, user_name, slot_code, vehicle_number, entry_time, exit_time, is_active) -> dict:
+    """Build one parking log row (shared by the paged list and the NDJSON export)."""
+    # Calculate duration
+    duration_mins = None
+    if exit_time and entry_time:
+        duration_mins = int((exit_time - entry_time).total_seconds() / 60)
+    
+    return {
+        "id": str(alloc_id),
+        "user_name": user_name,
+        "slot_code": slot_code,
+        "vehicle_number": vehicle_number,
+        "entry_time": entry_time.isoformat() if entry_time else None,
+        "exit_time": exit_time.isoformat() if exit_time else None,
+        "duration_mins": duration_mins,
+        "is_active": is_active
+    }
+
 
 # ============== Permission Helpers ==============
 
+_ADMIN_ROLES = frozenset({UserRole.SUPER_ADMIN, UserRole.ADMIN})
+
+
+def _can_manage_parking(role: UserRole, manager_type: Optional[ManagerType]) -> bool:
+    """SUPER_ADMIN, ADMIN, or the PARKING Manager."""
+    if role in _ADMIN_ROLES:
+        return True
+    return role == UserRole.MANAGER and manager_type == ManagerType.PARKING
+
+
 async def require_parking_admin(
     current_user: User = Depends(get_current_user),
 ) -> User:
     """
     Only SUPER_ADMIN, ADMIN, or PARKING Manager can manage slots.
     """
-    if current_user.role in [UserRole.SUPER_ADMIN, UserRole.ADMIN]:
-        return current_user
-    
-    if current_user.role == UserRole.MANAGER and current_user.manager_type == ManagerType.PARKING:
+    if _can_manage_parking(current_user.role, current_user.manager_type):
         return current_user
     
     raise HTTPException(
@@ -141,39 +179,25 @@ async def release_parking(
     """
     service = ParkingService(db)
     
-    # Find user's active parking
-    allocation = await service.check_user_active_parking(current_user.user_code)
-    if not allocation:
+    allocation, error = await service.release_user_parking(current_user)
+    if error:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="No active parking found"
+            detail=error
         )
     
-    # Get the slot
-    slot = await service.get_slot_by_id(allocation.slot_id)
-    
-    # Record exit time
-    exit_time = datetime.now(timezone.utc)
-    duration_mins = int((exit_time - allocation.entry_time).total_seconds() / 60)
+    slot = allocation.slot
+    duration_mins = int((allocation.exit_time - allocation.entry_time).total_seconds() / 60)
     if duration_mins < 1:
         duration_mins = 1  # Minimum 1 minute
     
-    allocation.exit_time = exit_time
-    allocation.is_active = False
-    
-    # Free up the slot
-    if slot:
-        slot.status = ParkingSlotStatus.AVAILABLE
-    
-    await db.commit()
-    
     return create_response(
         data={
             "message": "Parking released successfully",
             "slot_code": slot.slot_code if slot else "UNKNOWN",
             "vehicle_number": allocation.vehicle_number,
             "entry_time": allocation.entry_time.isoformat(),
-            "exit_time": exit_time.isoformat(),
+            "exit_time": allocation.exit_time.isoformat(),
             "duration_mins": duration_mins
         },
         message="Parking released successfully"
@@ -205,7 +229,7 @@ async def get_my_parking(
             message="No active parking"
         )
     
-    slot = await service.get_slot_by_id(allocation.slot_id)
+    slot = allocation.slot
     
     return create_response(
         data={
@@ -247,33 +271,78 @@ async def list_slots(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     status_filter: Optional[str] = Query(None, alias="status"),
+    after: Optional[UUID] = Query(None, description="Cursor: next_cursor from the previous page (replaces skip)"),
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     📋 List all parking slots with occupant details.
-    """
-    service = ParkingService(db)
     
-    # Build query
-    query = select(ParkingSlot).where(ParkingSlot.is_active == True)
+    Pass `after=<next_cursor>` to page by cursor instead of `skip`.
+    Responses carry an `ETag`; send it back as `If-None-Match` to get an
+    empty 304 when nothing changed.
+    """
+    conditions = [ParkingSlot.is_active == True]
     
     if status_filter:
         try:
             status_enum = ParkingSlotStatus(status_filter.upper())
-            query = query.where(ParkingSlot.status == status_enum)
+            conditions.append(ParkingSlot.status == status_enum)
         except ValueError:
             pass
     
-    query = query.offset(skip).limit(limit)
+    # Version of everything the body shows. Every allocate/release/status
+    # change touches the slot's updated_at and adds/removals change the
+    # count; the occupant columns come from the active allocations and
+    # their users, so those rows are part of the version too. Sums catch an
+    # update whose timestamp isn't the newest (a commit from an older
+    # transaction). Checked first so an unchanged list costs one aggregate
+    # query instead of the listing plus occupant lookups.
+    slot_version = select(
+        func.count(ParkingSlot.id).label("total"),
+        func.max(ParkingSlot.updated_at).label("last_updated"),
+        func.sum(func.extract("epoch", ParkingSlot.updated_at)).label("slots_sum")
+    ).where(*conditions).subquery()
+    occupant_version = (
+        select(
+            func.count(ParkingAllocation.id).label("occupied"),
+            func.sum(func.extract("epoch", ParkingAllocation.updated_at)).label("allocations_sum"),
+            func.sum(func.extract("epoch", User.updated_at)).label("users_sum")
+        )
+        .outerjoin(User, User.user_code == ParkingAllocation.user_code)
+        .where(
+            ParkingAllocation.is_active == True,
+            ParkingAllocation.slot_id.in_(select(ParkingSlot.id).where(*conditions))
+        )
+        .subquery()
+    )
+    version_result = await db.execute(
+        select(slot_version, occupant_version)
+        .select_from(slot_version.join(occupant_version, true()))
+    )
+    version = version_result.one()
+    total = version.total
+    last_updated = version.last_updated.timestamp() if version.last_updated else 0
+    etag = (
+        f'W/"slots-{total}-{last_updated}-{version.slots_sum or 0}'
+        f'-{version.occupied}-{version.allocations_sum or 0}-{version.users_sum or 0}"'
+    )
+    # Authenticated data: browsers may revalidate it, shared caches must not keep it
+    cache_headers = {"ETag": etag, "Cache-Control": "private"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    
+    # The version query already counted the matching slots
+    query = select(ParkingSlot).where(*conditions)
+    if after:
+        query = query.where(ParkingSlot.id > after)
+    else:
+        query = query.offset(skip)
+    query = query.order_by(ParkingSlot.id).limit(limit)
     result = await db.execute(query)
     slots = result.scalars().all()
     
-    # Get total count
-    count_query = select(ParkingSlot).where(ParkingSlot.is_active == True)
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
-    
     # Build response with occupant info
     slots_data = []
     for slot in slots:
@@ -302,8 +371,7 @@ async def list_slots(
                 slot_info["user_email"] = "Visitor"
             else:
                 # Get user name
-                from app.models.user import User as UserModel
-                user_query = select(UserModel).where(UserModel.user_code == allocation.user_code)
+                user_query = select(User).where(User.user_code == allocation.user_code)
                 user_result = await db.execute(user_query)
                 user = user_result.scalar_one_or_none()
                 slot_info["current_occupant"] = f"{user.first_name} {user.last_name}" if user else allocation.user_code
@@ -312,10 +380,16 @@ async def list_slots(
         
         slots_data.append(slot_info)
     
-    return create_response(
-        data={"total": total, "slots": slots_data},
+    response = create_serialized_response(
+        data={
+            "total": total,
+            "slots": slots_data,
+            "next_cursor": str(slots[-1].id) if len(slots) == limit else None
+        },
         message="Slots retrieved successfully"
     )
+    response.headers.update(cache_headers)
+    return response
 
 
 @router.post("/slots/create", response_model=APIResponse[dict])
@@ -369,27 +443,18 @@ async def delete_slot(
 ):
     """
     🗑️ Delete a parking slot (Admin only). Cannot delete occupied slots.
-    """
-    result = await db.execute(
-        select(ParkingSlot).where(ParkingSlot.slot_code == slot_code.upper())
-    )
-    slot = result.scalar_one_or_none()
     
-    if not slot:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Slot not found"
-        )
+    The slot is deactivated, not removed, so its parking history stays intact.
+    """
+    service = ParkingService(db)
     
-    if slot.status == ParkingSlotStatus.OCCUPIED:
+    success, error = await service.delete_slot(slot_code.upper(), current_user)
+    if not success:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot delete occupied slot"
+            status_code=status.HTTP_404_NOT_FOUND if error == "Slot not found" else status.HTTP_400_BAD_REQUEST,
+            detail=error
         )
     
-    await db.delete(slot)
-    await db.commit()
-    
     return create_response(
         data={"message": "Slot deleted successfully"},
         message="Slot deleted successfully"
@@ -408,7 +473,10 @@ async def change_slot_status(
     If changing from OCCUPIED to AVAILABLE, auto-releases parking.
     """
     result = await db.execute(
-        select(ParkingSlot).where(ParkingSlot.slot_code == slot_code.upper())
+        select(ParkingSlot).where(
+            ParkingSlot.slot_code == slot_code.upper(),
+            ParkingSlot.is_active == True
+        )
     )
     slot = result.scalar_one_or_none()
     
@@ -466,7 +534,10 @@ async def assign_visitor(
     """
     # Find the slot
     result = await db.execute(
-        select(ParkingSlot).where(ParkingSlot.slot_code == slot_code.upper())
+        select(ParkingSlot).where(
+            ParkingSlot.slot_code == slot_code.upper(),
+            ParkingSlot.is_active == True
+        )
     )
     slot = result.scalar_one_or_none()
     
@@ -525,66 +596,87 @@ async def list_parking_logs(
     page_size: int = Query(20, ge=1, le=100),
     search: Optional[str] = None,
     is_active: Optional[bool] = None,
+    after: Optional[UUID] = Query(None, description="Cursor: next_cursor from the previous page (replaces page)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_parking_admin),
 ):
     """
     📜 Get parking history logs (Admin only).
-    """
-    query = select(ParkingAllocation)
-    
-    if is_active is not None:
-        query = query.where(ParkingAllocation.is_active == is_active)
     
-    query = query.order_by(ParkingAllocation.entry_time.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
-    
-    result = await db.execute(query)
-    allocations = result.scalars().all()
-    
-    # Get total
-    count_query = select(ParkingAllocation)
-    if is_active is not None:
-        count_query = count_query.where(ParkingAllocation.is_active == is_active)
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+    Pass `after=<next_cursor>` to page by cursor instead of `page`.
+    """
+    service = ParkingService(db)
+    allocations, total = await service.list_allocations(
+        is_active=is_active,
+        page=page,
+        page_size=page_size,
+        after=after
+    )
     
     logs = []
     for alloc in allocations:
-        # Get slot info
-        slot = await db.execute(select(ParkingSlot).where(ParkingSlot.id == alloc.slot_id))
-        slot_obj = slot.scalar_one_or_none()
+        alloc_id, slot, user, user_code, visitor_name, vehicle_number, entry_time, exit_time, is_active = _LOG_ATTRS(alloc)
         
-        # Get user info if employee
-        user_name = alloc.visitor_name
-        if alloc.user_code:
-            from app.models.user import User as UserModel
-            user_result = await db.execute(select(UserModel).where(UserModel.user_code == alloc.user_code))
-            user = user_result.scalar_one_or_none()
-            user_name = f"{user.first_name} {user.last_name}" if user else alloc.user_code
+        # Slot and user were eager-loaded with the page
+        user_name = visitor_name
+        if user_code:
+            user_name = f"{user.first_name} {user.last_name}" if user else user_code
         
-        # Calculate duration
-        duration_mins = None
-        if alloc.exit_time and alloc.entry_time:
-            duration_mins = int((alloc.exit_time - alloc.entry_time).total_seconds() / 60)
-        
-        logs.append({
-            "id": str(alloc.id),
-            "user_name": user_name,
-            "slot_code": slot_obj.slot_code if slot_obj else "UNKNOWN",
-            "vehicle_number": alloc.vehicle_number,
-            "entry_time": alloc.entry_time.isoformat() if alloc.entry_time else None,
-            "exit_time": alloc.exit_time.isoformat() if alloc.exit_time else None,
-            "duration_mins": duration_mins,
-            "is_active": alloc.is_active
-        })
+        logs.append(_log_entry(
+            alloc_id, user_name, slot.slot_code if slot else "UNKNOWN",
+            vehicle_number, entry_time, exit_time, is_active
+        ))
     
-    return create_response(
+    return create_serialized_response(
         data={
             "total": total,
             "page": page,
             "page_size": page_size,
-            "logs": logs
+            "logs": logs,
+            "next_cursor": str(allocations[-1].id) if len(allocations) == page_size else None
         },
         message="Parking logs retrieved"
     )
+
+
+@router.get("/logs/export")
+async def export_parking_logs(
+    is_active: Optional[bool] = None,
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    current_user: User = Depends(require_parking_admin),
+):
+    """
+    📤 Export the full parking history as NDJSON (Admin only).
+    
+    One JSON log object per line, streamed from a server-side cursor so the
+    whole history is never held in memory.
+    """
+    query = (
+        select(
+            ParkingAllocation.id, ParkingAllocation.user_code, ParkingAllocation.visitor_name,
+            ParkingAllocation.vehicle_number, ParkingAllocation.entry_time,
+            ParkingAllocation.exit_time, ParkingAllocation.is_active,
+            ParkingSlot.slot_code, User.first_name, User.last_name
+        )
+        .outerjoin(ParkingSlot, ParkingSlot.id == ParkingAllocation.slot_id)
+        .outerjoin(User, User.user_code == ParkingAllocation.user_code)
+        .order_by(ParkingAllocation.entry_time.desc(), ParkingAllocation.id.desc())
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    if is_active is not None:
+        query = query.where(ParkingAllocation.is_active == is_active)
+    
+    async def generate():
+        # Own session: the request-scoped one is closed before the body streams
+        async with session_factory() as session:
+            result = await session.stream(query)
+            async for row in result:
+                user_name = row.visitor_name
+                if row.user_code:
+                    user_name = f"{row.first_name} {row.last_name}" if row.first_name else row.user_code
+                yield orjson.dumps(_log_entry(
+                    row.id, user_name, row.slot_code or "UNKNOWN", row.vehicle_number,
+                    row.entry_time, row.exit_time, row.is_active
+                )) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Optional, List
 from uuid import UUID
 
 from ....core.database import get_db
@@ -10,7 +10,7 @@ from ....core.dependencies import (
 from ....models.user import User
 from ....models.enums import UserRole, ManagerType
 from ....schemas.user import (
-    UserCreate, UserUpdate, UserResponse, PasswordUpdateByAdmin, UserRoleChange
+    UserCreate, UserBulkCreate, UserUpdate, UserResponse, PasswordUpdateByAdmin, UserRoleChange
 )
 from ....schemas.base import APIResponse, PaginatedResponse
 from ....services.user_service import UserService
@@ -74,6 +74,34 @@ async def create_user(
     )
 
 
+@router.post("/bulk", response_model=APIResponse[List[UserResponse]])
+async def bulk_create_users(
+    bulk_data: UserBulkCreate,
+    current_user: User = Depends(require_admin_or_above),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create up to 100 users in one request - SUPER_ADMIN and ADMIN only.
+    
+    Each entry takes the same fields and follows the same permission rules
+    as POST /users. The batch is all-or-nothing: if any entry is rejected,
+    no user is created and the error names the offending entry.
+    """
+    user_service = UserService(db)
+    users, error = await user_service.bulk_create_users(bulk_data.users, current_user)
+    
+    if error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error
+        )
+    
+    return create_response(
+        data=[UserResponse.model_validate(u) for u in users],
+        message=f"{len(users)} users created successfully"
+    )
+
+
 @router.get("", response_model=PaginatedResponse[UserResponse])
 async def list_users(
     page: int = Query(1, ge=1),
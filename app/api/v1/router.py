@@ -3,7 +3,7 @@ from fastapi import APIRouter
 from .endpoints import (
     auth, users, parking,
     desks, cafeteria, food_orders, attendance, leave,
-    it_assets, it_requests, projects, search, holidays
+    it_assets, it_requests, projects, search, holidays, batch
 )
 
 api_router = APIRouter()
@@ -20,4 +20,5 @@ api_router.include_router(it_assets.router, prefix="/it-assets", tags=["IT Asset
 api_router.include_router(it_requests.router, prefix="/it-requests", tags=["IT Requests"])
 api_router.include_router(projects.router, prefix="/projects", tags=["Projects"])
 api_router.include_router(search.router, prefix="/search", tags=["Search"])
-api_router.include_router(holidays.router, prefix="/holidays", tags=["Holidays"])
\ No newline at end of file
+api_router.include_router(holidays.router, prefix="/holidays", tags=["Holidays"])
+api_router.include_router(batch.router, prefix="/batch", tags=["Batch"])
\ No newline at end of file
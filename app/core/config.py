@@ -13,11 +13,13 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 12
     
     # Application
     APP_NAME: str = "Unified Office Management System"
     DEBUG: bool = True
     API_V1_PREFIX: str = "/api/v1"
+    TESTING: bool = False  # Test runs only: drops bcrypt to its minimum cost
     
     # Company
     COMPANY_DOMAIN: str = "company.com"
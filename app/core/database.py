@@ -32,6 +32,14 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def get_session_factory() -> async_sessionmaker:
+    """
+    Session factory for work that outlives the request, such as a streamed
+    response body (the get_db session is closed before the body streams).
+    """
+    return AsyncSessionLocal
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
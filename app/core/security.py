@@ -5,7 +5,14 @@ from passlib.context import CryptContext
 
 from .config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Work factor only applies to new hashes; existing hashes verify at the cost
+# they were created with. TESTING uses bcrypt's minimum (4 rounds, ~256x
+# cheaper than 12) so suites that create many users aren't CPU-bound on it.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=4 if settings.TESTING else settings.BCRYPT_ROUNDS
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -1,11 +1,13 @@
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from datetime import datetime, timezone
+from sqlalchemy import text
 import logging
 
 from .core.config import settings
+from .core.database import engine
 from .api.v1.router import api_router
 from .middleware.response_middleware import ResponseMiddleware
 
@@ -23,7 +25,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -95,6 +98,25 @@ async def health_check():
     }
 
 
+@app.get("/health/pgvector")
+async def pgvector_health_check():
+    """
+    Report whether the pgvector extension is installed.
+    
+    Semantic search depends on it; clients (and the test suite) can check
+    this once up front instead of issuing searches that are bound to fail.
+    """
+    async with engine.connect() as conn:
+        available = await conn.scalar(
+            text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'vector')")
+        )
+    return {
+        "status": "available" if available else "unavailable",
+        "pgvector": bool(available),
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -1,5 +1,5 @@
 from sqlalchemy import (
-    Column, String, Boolean, DateTime, ForeignKey, Text, Index, Enum, Integer, event
+    Column, String, Boolean, DateTime, ForeignKey, Text, Index, Enum, Integer, event, text
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -101,6 +101,11 @@ class ParkingAllocation(Base, TimestampMixin):
         Index("ix_parking_allocation_user", "user_code", "is_active"),
         Index("ix_parking_allocation_slot", "slot_id", "is_active"),
         Index("ix_parking_allocation_entry", "entry_time"),
+        # Small index of active rows only, for the per-user active lookup
+        Index(
+            "ix_parking_allocation_active_user", "user_code",
+            postgresql_where=text("is_active")
+        ),
     )
 
 
@@ -4,7 +4,7 @@ from .auth import (
     TokenRefreshResponse, PasswordChangeRequest
 )
 from .user import (
-    UserCreate, UserUpdate, UserResponse, UserListResponse,
+    UserCreate, UserBulkCreate, UserUpdate, UserResponse, UserListResponse,
     UserDetailResponse, TeamMemberResponse, PasswordUpdateByAdmin
 )
 from .parking import (
@@ -70,7 +70,7 @@ __all__ = [
     "TokenRefreshResponse", "PasswordChangeRequest",
     
     # User
-    "UserCreate", "UserUpdate", "UserResponse", "UserListResponse",
+    "UserCreate", "UserBulkCreate", "UserUpdate", "UserResponse", "UserListResponse",
     "UserDetailResponse", "TeamMemberResponse", "PasswordUpdateByAdmin",
     
     # Parking
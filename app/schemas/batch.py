@@ -0,0 +1,47 @@
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional, List, Dict, Any, Literal
+
+
+# ==================== Batch Schemas ====================
+
+class BatchSubRequest(BaseModel):
+    """One API call inside a batch."""
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
+    path: str = Field(
+        ..., min_length=1, max_length=500,
+        description="API path, with or without the /api/v1 prefix (e.g. /desks)"
+    )
+    headers: Dict[str, str] = Field(default_factory=dict)
+    body: Optional[Any] = None
+    
+    @field_validator('method', mode='before')
+    @classmethod
+    def normalize_method(cls, v):
+        return v.upper() if isinstance(v, str) else v
+    
+    @field_validator('path')
+    @classmethod
+    def validate_path(cls, v: str) -> str:
+        if not v.startswith('/'):
+            raise ValueError('path must start with /')
+        return v
+
+
+class BatchRequest(BaseModel):
+    """
+    Batch of API calls executed in order within one HTTP round-trip.
+    
+    Max 20 sub-requests per batch.
+    """
+    requests: List[BatchSubRequest] = Field(..., min_length=1, max_length=20)
+
+
+class BatchSubResponse(BaseModel):
+    """Outcome of one sub-request (same index as in the batch)."""
+    status: int
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    """Batch response schema."""
+    responses: List[BatchSubResponse]
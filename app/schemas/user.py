@@ -82,6 +82,11 @@ class UserCreate(UserBase):
         return self
 
 
+class UserBulkCreate(BaseModel):
+    """Bulk user creation - same rules as UserCreate, applied per entry."""
+    users: List[UserCreate] = Field(..., min_length=1, max_length=100)
+
+
 class UserUpdate(BaseModel):
     """User update schema - limited fields that can be updated."""
     first_name: Optional[str] = Field(None, min_length=1, max_length=100)
@@ -159,9 +159,8 @@ class ITAssetService:
             return None, f"Asset is not available (current status: {asset.status.value})"
         
         # Get user_code from user_id
-        from ..models.user import User as UserModel
         user_result = await self.db.execute(
-            select(UserModel).where(UserModel.id == user_id)
+            select(User).where(User.id == user_id)
         )
         target_user = user_result.scalar_one_or_none()
         if not target_user:
@@ -260,7 +259,6 @@ class ITAssetService:
     ) -> List[ITAssetAssignment]:
         """Get all asset assignments for a user."""
         # Get user_code from user_id
-        from ..models.user import User
         user_result = await self.db.execute(
             select(User).where(User.id == user_id)
         )
@@ -8,6 +8,7 @@ import uuid as uuid_lib
 from sqlalchemy.orm import selectinload
 
 from ..models.it_request import ITRequest
+from ..models.it_asset import ITAsset
 from ..models.user import User
 from ..models.enums import ITRequestType, ITRequestStatus, UserRole
 from ..schemas.it_request import ITRequestCreate, ITRequestUpdate
@@ -55,12 +56,9 @@ class ITRequestService:
         user: User
     ) -> Tuple[Optional[ITRequest], Optional[str]]:
         """Create a new IT request."""
-        from sqlalchemy.orm import selectinload
-        
         # Look up asset_id from related_asset_code if provided
         asset_id = None
         if hasattr(request_data, 'related_asset_code') and request_data.related_asset_code:
-            from ..models.it_asset import ITAsset
             result = await self.db.execute(
                 select(ITAsset).where(ITAsset.asset_code == request_data.related_asset_code)
             )
@@ -242,8 +240,6 @@ class ITRequestService:
         page_size: int = 20
     ) -> Tuple[List[ITRequest], int]:
         """List IT requests with filtering."""
-        from sqlalchemy.orm import selectinload
-        
         query = select(ITRequest).options(
             selectinload(ITRequest.user),
             selectinload(ITRequest.asset),
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, update, func, and_, or_
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
@@ -14,6 +15,38 @@ from ..schemas.parking import (
 )
 
 
+def _paged_total_column(count_column, conditions: list, after: Optional[UUID]):
+    """
+    Column carrying the filtered total on every row of a page.
+    A window count is enough for offset pages; with a keyset cursor the
+    window would only see rows past the cursor, so use an uncorrelated
+    scalar subquery over the same filters instead.
+    """
+    if after is None:
+        return func.count().over().label("total")
+    count_query = select(func.count(count_column))
+    if conditions:
+        count_query = count_query.where(and_(*conditions))
+    return count_query.correlate(None).scalar_subquery().label("total")
+
+
+def _allocation_keyset_condition(after: UUID):
+    """
+    Keyset condition for allocations ordered by (entry_time DESC, id DESC):
+    rows strictly after the allocation whose id is the cursor.
+    """
+    cursor_time = (
+        select(ParkingAllocation.entry_time)
+        .where(ParkingAllocation.id == after)
+        .correlate(None)
+        .scalar_subquery()
+    )
+    return or_(
+        ParkingAllocation.entry_time < cursor_time,
+        and_(ParkingAllocation.entry_time == cursor_time, ParkingAllocation.id < after)
+    )
+
+
 class ParkingService:
     """
     Parking management service.
@@ -85,6 +118,20 @@ class ParkingService:
         
         return slots, total
     
+    async def _count(self, column, conditions: list, paged: bool) -> int:
+        """
+        Fallback count for an empty page.
+        An empty first page means there are no rows at all; past the last
+        page (or cursor) the per-row total isn't available, so count explicitly.
+        """
+        if not paged:
+            return 0
+        count_query = select(func.count(column))
+        if conditions:
+            count_query = count_query.where(and_(*conditions))
+        result = await self.db.execute(count_query)
+        return result.scalar() or 0
+    
     async def create_slot(
         self,
         slot_data: ParkingSlotCreate,
@@ -133,30 +180,42 @@ class ParkingService:
     
     async def delete_slot(
         self,
-        slot_id: UUID,
+        slot_code: str,
         user: User
     ) -> Tuple[bool, Optional[str]]:
-        """Soft delete a parking slot - Manager only."""
+        """Soft delete a parking slot - Manager only. Occupied slots are kept."""
         if not self.can_manage_parking(user):
             return False, "Only PARKING Manager can delete parking slots"
         
-        slot = await self.get_slot_by_id(slot_id)
-        if not slot:
-            return False, "Parking slot not found"
-        
-        # Check for active allocations
-        active_allocation = await self.db.execute(
-            select(ParkingAllocation).where(
+        # Soft delete in one round trip; the occupied checks are part of the WHERE
+        has_active_allocation = select(ParkingAllocation.id).where(
+            and_(
+                ParkingAllocation.slot_id == ParkingSlot.id,
+                ParkingAllocation.is_active == True
+            )
+        ).exists()
+        result = await self.db.execute(
+            update(ParkingSlot)
+            .where(
                 and_(
-                    ParkingAllocation.slot_id == slot_id,
-                    ParkingAllocation.is_active == True
+                    ParkingSlot.slot_code == slot_code,
+                    ParkingSlot.is_active == True,
+                    ParkingSlot.status.is_distinct_from(ParkingSlotStatus.OCCUPIED),
+                    ~has_active_allocation
                 )
             )
+            .values(is_active=False)
+            .returning(ParkingSlot.id)
+            .execution_options(synchronize_session="fetch")
         )
-        if active_allocation.scalar_one_or_none():
-            return False, "Cannot delete slot with active allocation"
         
-        slot.is_active = False
+        if result.first() is None:
+            # Nothing updated - look up why (error path only)
+            slot = await self.get_slot_by_code(slot_code)
+            if not slot or not slot.is_active:
+                return False, "Slot not found"
+            return False, "Cannot delete occupied slot"
+        
         await self.db.commit()
         
         return True, None
@@ -173,9 +232,14 @@ class ParkingService:
         return result.scalar_one_or_none()
     
     async def check_user_active_parking(self, user_code: str) -> Optional[ParkingAllocation]:
-        """Check if user has an active parking allocation."""
+        """
+        Check if user has an active parking allocation (slot eager-loaded).
+        No LIMIT: a second active allocation is a data error and should raise.
+        """
         result = await self.db.execute(
-            select(ParkingAllocation).where(
+            select(ParkingAllocation)
+            .options(selectinload(ParkingAllocation.slot))
+            .where(
                 and_(
                     ParkingAllocation.user_code == user_code,
                     ParkingAllocation.is_active == True,
@@ -350,29 +414,90 @@ class ParkingService:
         user: User
     ) -> Tuple[Optional[ParkingAllocation], Optional[str]]:
         """Record parking exit."""
-        allocation = await self.get_allocation_by_id(allocation_id)
+        # The active and ownership checks are part of the WHERE
+        # (managers can release any parking)
+        conditions = [
+            ParkingAllocation.id == allocation_id,
+            ParkingAllocation.is_active == True
+        ]
+        if not self.can_manage_parking(user):
+            conditions.append(ParkingAllocation.user_code == user.user_code)
+        
+        allocation = await self._close_allocation(conditions)
         if not allocation:
-            return None, "Allocation not found"
+            # Nothing updated - look up why (error path only)
+            existing = await self.get_allocation_by_id(allocation_id)
+            if not existing:
+                return None, "Allocation not found"
+            if not existing.is_active:
+                return None, "Allocation is not active"
+            return None, "Cannot release another user's parking"
         
-        if not allocation.is_active:
-            return None, "Allocation is not active"
+        await self.db.commit()
         
-        # Check permission - user can release own parking, or manager can release any
-        if allocation.user_code != user.user_code:
-            if not self.can_manage_parking(user):
-                return None, "Cannot release another user's parking"
+        return allocation, None
+    
+    async def release_user_parking(
+        self,
+        user: User
+    ) -> Tuple[Optional[ParkingAllocation], Optional[str]]:
+        """Record exit for the user's own active parking."""
+        active_id = (
+            select(ParkingAllocation.id)
+            .where(
+                and_(
+                    ParkingAllocation.user_code == user.user_code,
+                    ParkingAllocation.is_active == True
+                )
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
+        allocation = await self._close_allocation([
+            ParkingAllocation.id == active_id,
+            ParkingAllocation.is_active == True
+        ])
+        if not allocation:
+            return None, "No active parking found"
         
-        allocation.exit_time = datetime.now(timezone.utc)
-        allocation.is_active = False
+        await self.db.commit()
         
-        # Update slot status
-        slot = await self.get_slot_by_id(allocation.slot_id)
-        if slot:
-            slot.status = ParkingSlotStatus.AVAILABLE
+        return allocation, None
+    
+    async def _close_allocation(self, conditions: list) -> Optional[ParkingAllocation]:
+        """
+        Close the single allocation matching `conditions`, free its slot and
+        write the history row. Returns None (nothing changed) if no active
+        allocation matched. The caller commits.
+        """
+        exit_time = datetime.now(timezone.utc)
+        
+        result = await self.db.execute(
+            update(ParkingAllocation)
+            .where(and_(*conditions))
+            .values(exit_time=exit_time, is_active=False)
+            .returning(ParkingAllocation)
+            .execution_options(populate_existing=True)
+        )
+        allocation = result.scalar_one_or_none()
+        if not allocation:
+            return None
+        
+        # Free the slot and read it back, so the returned allocation carries
+        # its slot like the other allocation responses (history needs the code)
+        slot_result = await self.db.execute(
+            update(ParkingSlot)
+            .where(ParkingSlot.id == allocation.slot_id)
+            .values(status=ParkingSlotStatus.AVAILABLE)
+            .returning(ParkingSlot)
+            .execution_options(populate_existing=True)
+        )
+        slot = slot_result.scalar_one_or_none()
+        set_committed_value(allocation, "slot", slot)
         
         # Create history record
-        duration = (allocation.exit_time - allocation.entry_time).total_seconds() / 60
-        history = ParkingHistory(
+        duration = (exit_time - allocation.entry_time).total_seconds() / 60
+        self.db.add(ParkingHistory(
             allocation_id=allocation.id,
             slot_id=allocation.slot_id,
             slot_code=slot.slot_code if slot else "UNKNOWN",
@@ -382,15 +507,11 @@ class ParkingService:
             vehicle_number=allocation.vehicle_number,
             vehicle_type=allocation.vehicle_type,
             entry_time=allocation.entry_time,
-            exit_time=allocation.exit_time,
+            exit_time=exit_time,
             duration_minutes=int(duration)
-        )
-        
-        self.db.add(history)
-        await self.db.commit()
-        await self.db.refresh(allocation)
+        ))
         
-        return allocation, None
+        return allocation
     
     async def list_allocations(
         self,
@@ -399,12 +520,14 @@ class ParkingService:
         parking_type: Optional[ParkingType] = None,
         is_active: Optional[bool] = True,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        after: Optional[UUID] = None
     ) -> Tuple[List[ParkingAllocation], int]:
-        """List parking allocations with filtering."""
-        query = select(ParkingAllocation).options(selectinload(ParkingAllocation.slot))
-        count_query = select(func.count(ParkingAllocation.id))
-        
+        """
+        List parking allocations with filtering, newest entry first.
+        Pass the last allocation id of the previous page as `after` for
+        keyset pagination (page is then ignored).
+        """
         conditions = []
         if slot_id:
             conditions.append(ParkingAllocation.slot_id == slot_id)
@@ -415,19 +538,28 @@ class ParkingService:
         if is_active is not None:
             conditions.append(ParkingAllocation.is_active == is_active)
         
+        # Total comes back on every row - one round trip
+        query = (
+            select(ParkingAllocation, _paged_total_column(ParkingAllocation.id, conditions, after))
+            .options(selectinload(ParkingAllocation.slot), selectinload(ParkingAllocation.user))
+        )
         if conditions:
             query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
         
-        # Get total count
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-        
-        # Get paginated results
-        query = query.order_by(ParkingAllocation.entry_time.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
+        if after:
+            query = query.where(_allocation_keyset_condition(after))
+        else:
+            query = query.offset((page - 1) * page_size)
+        query = query.order_by(ParkingAllocation.entry_time.desc(), ParkingAllocation.id.desc())
+        query = query.limit(page_size)
         result = await self.db.execute(query)
-        allocations = list(result.scalars().all())
+        rows = result.all()
+        
+        allocations = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        else:
+            total = await self._count(ParkingAllocation.id, conditions, page > 1 or after is not None)
         
         return allocations, total
     
@@ -447,37 +579,26 @@ class ParkingService:
     
     async def get_parking_stats(self) -> dict:
         """Get parking statistics."""
-        # Total slots
-        total_result = await self.db.execute(
-            select(func.count(ParkingSlot.id)).where(ParkingSlot.is_active == True)
-        )
-        total_slots = total_result.scalar() or 0
-        
-        # Employee slots
-        emp_result = await self.db.execute(
-            select(func.count(ParkingSlot.id)).where(
-                and_(
-                    ParkingSlot.is_active == True,
-                    ParkingSlot.parking_type == ParkingType.EMPLOYEE
-                )
+        # All counts in a single statement (one round trip)
+        occupied = select(func.count(ParkingAllocation.id)).where(
+            and_(
+                ParkingAllocation.is_active == True,
+                ParkingAllocation.exit_time.is_(None)
             )
+        ).scalar_subquery()
+        
+        result = await self.db.execute(
+            select(
+                func.count(ParkingSlot.id),
+                func.count(ParkingSlot.id).filter(ParkingSlot.parking_type == ParkingType.EMPLOYEE),
+                occupied
+            ).where(ParkingSlot.is_active == True)
         )
-        employee_slots = emp_result.scalar() or 0
+        total_slots, employee_slots, occupied_slots = result.one()
         
         # Visitor slots
         visitor_slots = total_slots - employee_slots
         
-        # Occupied slots
-        occupied_result = await self.db.execute(
-            select(func.count(ParkingAllocation.id)).where(
-                and_(
-                    ParkingAllocation.is_active == True,
-                    ParkingAllocation.exit_time.is_(None)
-                )
-            )
-        )
-        occupied_slots = occupied_result.scalar() or 0
-        
         available_slots = total_slots - occupied_slots
         occupancy_percentage = (occupied_slots / total_slots * 100) if total_slots > 0 else 0
         
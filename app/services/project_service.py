@@ -4,6 +4,8 @@ from sqlalchemy.orm import selectinload
 from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime, timezone, timedelta
+import random
+import string
 
 from ..models.project import Project, ProjectMember
 from ..models.user import User
@@ -42,8 +44,6 @@ class ProjectService:
     
     def generate_project_code(self) -> str:
         """Generate unique project code: PRJ-YYYYMMDD-XXXX"""
-        import random
-        import string
         date_str = datetime.now(timezone.utc).strftime('%Y%m%d')
         random_str = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
         return f"PRJ-{date_str}-{random_str}"
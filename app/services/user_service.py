@@ -133,9 +133,75 @@ class UserService:
         self,
         user_data: UserCreate,
         created_by: User
+    ) -> Tuple[Optional[User], Optional[str]]:
+        """Create a new user - Only SUPER_ADMIN and ADMIN can create users."""
+        new_user, error = await self._build_user(user_data, created_by)
+        if error:
+            return None, error
+        
+        # Check for duplicate email
+        existing_email = await self.get_user_by_email(new_user.email)
+        if existing_email:
+            return None, f"Email '{new_user.email}' already exists"
+        
+        new_user.hashed_password = get_password_hash(user_data.password)
+        self.db.add(new_user)
+        await self.db.commit()
+        await self.db.refresh(new_user)
+        
+        return new_user, None
+    
+    async def bulk_create_users(
+        self,
+        users_data: List[UserCreate],
+        created_by: User
+    ) -> Tuple[List[User], Optional[str]]:
+        """
+        Create several users in one transaction (all or nothing).
+        
+        Each entry goes through the same permission and hierarchy checks as
+        create_user; duplicate emails are checked with a single query for the
+        whole batch and the rows are written with one flush/commit.
+        """
+        new_users = []
+        for index, user_data in enumerate(users_data, start=1):
+            new_user, error = await self._build_user(user_data, created_by)
+            if error:
+                return [], f"User {index}: {error}"
+            new_users.append(new_user)
+        
+        # Check for duplicate emails, within the batch and against the DB
+        emails = [u.email for u in new_users]
+        seen = set()
+        for email in emails:
+            if email in seen:
+                return [], f"Email '{email}' appears more than once"
+            seen.add(email)
+        
+        result = await self.db.execute(
+            select(User.email).where(
+                User.email.in_(emails),
+                User.is_deleted == False
+            )
+        )
+        existing_email = result.scalars().first()
+        if existing_email:
+            return [], f"Email '{existing_email}' already exists"
+        
+        for new_user, user_data in zip(new_users, users_data):
+            new_user.hashed_password = get_password_hash(user_data.password)
+        self.db.add_all(new_users)
+        await self.db.commit()
+        
+        return new_users, None
+    
+    async def _build_user(
+        self,
+        user_data: UserCreate,
+        created_by: User
     ) -> Tuple[Optional[User], Optional[str]]:
         """
-        Create a new user - Only SUPER_ADMIN and ADMIN can create users.
+        Validate a creation request and build the (unsaved) User.
         
         Permission Rules:
         - SUPER_ADMIN can create: ADMIN, MANAGER, TEAM_LEAD, EMPLOYEE
@@ -146,6 +212,9 @@ class UserService:
         - user_code: 6-character unique code (auto-generated by model)
         - created_by_code: Creator's user_code
         - hierarchy codes: Auto-assigned based on creator if not provided
+        
+        The password is hashed by the caller once the duplicate-email check
+        has passed, so a rejected request never pays for bcrypt.
         """
         
         # Only SUPER_ADMIN and ADMIN can create users
@@ -219,15 +288,9 @@ class UserService:
             last_name = user_data.last_name.lower().replace(' ', '')
             email = f"{first_name}.{last_name}@{settings.COMPANY_DOMAIN}"
         
-        # Check for duplicate email
-        existing_email = await self.get_user_by_email(email)
-        if existing_email:
-            return None, f"Email '{email}' already exists"
-        
         # Create user - user_code will be auto-generated by the model
         new_user = User(
             email=email,
-            hashed_password=get_password_hash(user_data.password),
             first_name=user_data.first_name,
             last_name=user_data.last_name,
             role=role,
@@ -246,10 +309,6 @@ class UserService:
             vehicle_type=user_data.vehicle_type,
         )
         
-        self.db.add(new_user)
-        await self.db.commit()
-        await self.db.refresh(new_user)
-        
         return new_user, None
     
     async def update_user(
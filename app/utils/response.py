@@ -2,6 +2,8 @@ from datetime import datetime, timezone
 from typing import TypeVar, Optional, List, Any
 import math
 
+from starlette.responses import Response
+
 from ..schemas.base import APIResponse, PaginatedResponse
 
 T = TypeVar("T")
@@ -21,6 +23,45 @@ def create_response(
     )
 
 
+def create_serialized_response(
+    data: Optional[T] = None,
+    message: str = "",
+    success: bool = True,
+    status_code: int = 200
+) -> Response:
+    """
+    Create a standard API response already serialized to JSON.
+    
+    Returning a Response makes FastAPI skip response_model processing, so
+    the payload is dumped exactly once by pydantic instead of being dumped,
+    re-validated and re-encoded. Keep response_model on the route for docs.
+    """
+    body = create_response(data=data, message=message, success=success)
+    return Response(
+        content=body.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag.
+    
+    Lets list endpoints answer 304 Not Modified before doing any of the
+    work needed to build the body.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque
+        for tag in if_none_match.split(",")
+    )
+
+
 def create_paginated_response(
     data: List[T],
     total: int,
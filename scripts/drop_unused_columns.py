@@ -0,0 +1,94 @@
+"""
+Post-deploy cleanup: physically drop the retired building/floor/zone columns.
+
+Migration c3d4e5f6g7h8 drops these columns. For a while that revision only
+retired them (no DDL), so databases upgraded in that window still have the
+columns and `alembic upgrade head` will not revisit them. Run this once on
+such a database after the release is live; it drops the leftovers under lock
+timeouts with retry. On any other database every statement is IF EXISTS and
+it is a no-op.
+
+Run with: python -m scripts.drop_unused_columns
+"""
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from app.core.database import engine
+
+
+# Guards so the ALTERs fail fast instead of queueing behind long-running
+# transactions (and blocking every other query behind them) on busy tables.
+LOCK_TIMEOUT = '2s'
+STATEMENT_TIMEOUT = '30s'
+MAX_ATTEMPTS = 5
+
+# lock_not_available (lock_timeout hit), query_canceled (statement_timeout hit)
+RETRYABLE_SQLSTATES = {'55P03', '57014'}
+
+TABLES = ['desks', 'conference_rooms', 'parking_slots', 'cafeteria_tables']
+
+
+def _sqlstate(error: DBAPIError):
+    """SQLSTATE of the driver error, if the driver exposes one."""
+    orig = error.orig
+    return getattr(orig, 'sqlstate', None) or getattr(orig.__cause__, 'sqlstate', None)
+
+
+async def run_ddl_with_retry(statement: str) -> None:
+    """
+    Run a DDL statement in its own transaction under lock/statement
+    timeouts, retrying with backoff on lock/statement timeouts only.
+    
+    DROP COLUMN is catalog-only on PostgreSQL; the space is reclaimed
+    lazily by later row updates/VACUUM.
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+                await conn.execute(text(f"SET LOCAL statement_timeout = '{STATEMENT_TIMEOUT}'"))
+                await conn.execute(text(statement))
+            return
+        except DBAPIError as e:
+            if _sqlstate(e) not in RETRYABLE_SQLSTATES or attempt == MAX_ATTEMPTS:
+                raise
+            delay = 0.5 * 2 ** (attempt - 1)
+            print(f"  ! {statement.split(' DROP')[0]} failed ({e.orig}), retrying in {delay}s")
+            await asyncio.sleep(delay)
+
+
+async def drop_unused_columns():
+    """Drop the building/floor indexes, then the columns on all tables in parallel."""
+    # All four indexes in one statement (one round trip)
+    await run_ddl_with_retry(
+        'DROP INDEX IF EXISTS '
+        + ', '.join(f'ix_{table}_building_floor' for table in TABLES)
+    )
+    print("✓ Dropped building/floor indexes")
+    
+    # One multi-action ALTER per table. The tables don't reference each
+    # other, so each runs on its own connection at the same time.
+    await asyncio.gather(*[
+        run_ddl_with_retry(
+            f'ALTER TABLE {table} '
+            'DROP COLUMN IF EXISTS building, DROP COLUMN IF EXISTS floor, DROP COLUMN IF EXISTS zone'
+        )
+        for table in TABLES
+    ])
+    print(f"✓ Dropped building/floor/zone from: {', '.join(TABLES)}")
+
+
+async def main():
+    try:
+        await drop_unused_columns()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
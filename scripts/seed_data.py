@@ -11,7 +11,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from app.core.database import AsyncSessionLocal
 from app.core.security import get_password_hash
 from app.models.user import User
@@ -219,38 +219,48 @@ async def seed_users(db: AsyncSession):
         },
     ]
     
-    created_users = []
-    for user_data in users:
-        # Check if user already exists
-        result = await db.execute(
-            select(User).where(User.email == user_data["email"])
-        )
-        existing = result.scalar_one_or_none()
-        
-        if existing:
-            print(f"  User already exists: {user_data['email']}")
-            created_users.append(existing)
-            continue
+    # Look up every seed email in one round-trip ...
+    result = await db.execute(
+        select(User).where(User.email.in_([u["email"] for u in users]))
+    )
+    users_by_email = {user.email: user for user in result.scalars()}
+    for email in users_by_email:
+        print(f"  User already exists: {email}")
+    
+    new_users = [u for u in users if u["email"] not in users_by_email]
+    if new_users:
+        # bcrypt is deliberately slow; hash each distinct password only once
+        password_hashes = {
+            password: get_password_hash(password)
+            for password in {u["password"] for u in new_users}
+        }
         
-        user = User(
-            user_code=user_data["user_code"],
-            email=user_data["email"],
-            hashed_password=get_password_hash(user_data["password"]),
-            first_name=user_data["first_name"],
-            last_name=user_data["last_name"],
-            role=user_data["role"],
-            manager_type=user_data.get("manager_type"),
-            department=user_data.get("department"),
-            vehicle_number=user_data["vehicle_number"],
-            vehicle_type=user_data.get("vehicle_type", VehicleType.CAR),
-            is_active=True
+        # ... and create the missing ones with a single multi-row INSERT
+        result = await db.execute(
+            insert(User).returning(User),
+            [
+                {
+                    "user_code": user_data["user_code"],
+                    "email": user_data["email"],
+                    "hashed_password": password_hashes[user_data["password"]],
+                    "first_name": user_data["first_name"],
+                    "last_name": user_data["last_name"],
+                    "role": user_data["role"],
+                    "manager_type": user_data.get("manager_type"),
+                    "department": user_data.get("department"),
+                    "vehicle_number": user_data["vehicle_number"],
+                    "vehicle_type": user_data.get("vehicle_type", VehicleType.CAR),
+                    "is_active": True,
+                }
+                for user_data in new_users
+            ]
         )
-        db.add(user)
-        created_users.append(user)
-        print(f"  Created user: {user_data['email']} (Code: {user_data['user_code']}, Role: {user_data['role'].value})")
+        for user in result.scalars():
+            users_by_email[user.email] = user
+            print(f"  Created user: {user.email} (Code: {user.user_code}, Role: {user.role.value})")
     
     await db.commit()
-    return created_users
+    return [users_by_email[u["email"]] for u in users]
 
 
 async def seed_desks(db: AsyncSession, users: list):
@@ -31,13 +31,25 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from app.core.database import AsyncSessionLocal
 from app.core.security import get_password_hash
 from app.models.user import User
 from app.models.enums import UserRole, ManagerType
 
 
+# Optional columns a given level may leave out. Every row carries all of them
+# so the bulk insert sees one key set and runs as a single batched statement.
+OPTIONAL_USER_FIELDS = {
+    "manager_type": None,
+    "department": None,
+    "admin_code": None,
+    "manager_code": None,
+    "team_lead_code": None,
+    "created_by_code": None,
+}
+
+
 async def seed_hierarchy(db: AsyncSession):
     """Seed the complete user hierarchy."""
     
@@ -51,32 +63,43 @@ async def seed_hierarchy(db: AsyncSession):
     
     print("Seeding hierarchical user structure...")
     
+    # bcrypt is deliberately slow; hash each shared password only once
+    admin_password = get_password_hash("Admin@123")
+    manager_password = get_password_hash("Manager@123")
+    team_lead_password = get_password_hash("TeamLead@123")
+    employee_password = get_password_hash("Employee@123")
+    
+    # User codes are fixed, so the whole hierarchy is collected as plain rows
+    # and written with one bulk insert(User) at the end (no per-level flush).
+    # Core-style inserts skip the unit of work: no identity map, no cascades,
+    # which is fine for a User table with no ORM relationships to populate.
+    rows = []
+    created = []  # reported only once the insert has committed
+    
     # 1. Create Super Admin
-    super_admin = User(
-        user_code="SA0001",
-        email="super.admin@cygnet.com",
-        hashed_password=get_password_hash("Admin@123"),
-        first_name="Super",
-        last_name="Admin",
-        role=UserRole.SUPER_ADMIN,
-    )
-    db.add(super_admin)
-    await db.flush()  # Get the user_code
-    print(f"✓ Created Super Admin: {super_admin.user_code}")
+    super_admin_code = "SA0001"
+    rows.append({
+        "user_code": super_admin_code,
+        "email": "super.admin@cygnet.com",
+        "hashed_password": admin_password,
+        "first_name": "Super",
+        "last_name": "Admin",
+        "role": UserRole.SUPER_ADMIN,
+    })
+    created.append(f"✓ Created Super Admin: {super_admin_code}")
     
     # 2. Create Admin (created by Super Admin)
-    admin = User(
-        user_code="AD0001",
-        email="admin@cygnet.com",
-        hashed_password=get_password_hash("Admin@123"),
-        first_name="Main",
-        last_name="Admin",
-        role=UserRole.ADMIN,
-        created_by_code=super_admin.user_code,
-    )
-    db.add(admin)
-    await db.flush()
-    print(f"✓ Created Admin: {admin.user_code} (created by {super_admin.user_code})")
+    admin_code = "AD0001"
+    rows.append({
+        "user_code": admin_code,
+        "email": "admin@cygnet.com",
+        "hashed_password": admin_password,
+        "first_name": "Main",
+        "last_name": "Admin",
+        "role": UserRole.ADMIN,
+        "created_by_code": super_admin_code,
+    })
+    created.append(f"✓ Created Admin: {admin_code} (created by {super_admin_code})")
     
     # 3. Create Managers (created by Admin)
     managers = [
@@ -117,27 +140,24 @@ async def seed_hierarchy(db: AsyncSession):
         },
     ]
     
-    manager_objects = {}
+    manager_codes = {}
     for m in managers:
-        manager = User(
-            user_code=m["user_code"],
-            email=m["email"],
-            hashed_password=get_password_hash("Manager@123"),
-            first_name=m["first_name"],
-            last_name=m["last_name"],
-            role=UserRole.MANAGER,
-            manager_type=m["manager_type"],
-            admin_code=admin.user_code,
-            created_by_code=admin.user_code,
-        )
-        db.add(manager)
-        manager_objects[m["manager_type"]] = manager
-        print(f"✓ Created Manager: {manager.user_code} ({m['manager_type'].value}) (admin: {admin.user_code})")
-    
-    await db.flush()
+        rows.append({
+            "user_code": m["user_code"],
+            "email": m["email"],
+            "hashed_password": manager_password,
+            "first_name": m["first_name"],
+            "last_name": m["last_name"],
+            "role": UserRole.MANAGER,
+            "manager_type": m["manager_type"],
+            "admin_code": admin_code,
+            "created_by_code": admin_code,
+        })
+        manager_codes[m["manager_type"]] = m["user_code"]
+        created.append(f"✓ Created Manager: {m['user_code']} ({m['manager_type'].value}) (admin: {admin_code})")
     
     # 4. Create Team Leads (created by Attendance Manager - only Attendance Manager can create TLs)
-    attendance_manager = manager_objects[ManagerType.ATTENDANCE]
+    attendance_manager_code = manager_codes[ManagerType.ATTENDANCE]
     team_leads = [
         {"user_code": "TL0001", "department": "Development", "first_name": "Dev", "last_name": "Lead"},
         {"user_code": "TL0002", "department": "Sales", "first_name": "Sales", "last_name": "Lead"},
@@ -145,24 +165,21 @@ async def seed_hierarchy(db: AsyncSession):
         {"user_code": "TL0004", "department": "HR", "first_name": "HR", "last_name": "Lead"},
     ]
     
-    team_lead_objects = {}
+    team_lead_codes = {}
     for tl in team_leads:
-        team_lead = User(
-            user_code=tl["user_code"],
-            email=f"{tl['department'].lower()}.lead@cygnet.com",
-            hashed_password=get_password_hash("TeamLead@123"),
-            first_name=tl["first_name"],
-            last_name=tl["last_name"],
-            role=UserRole.TEAM_LEAD,
-            department=tl["department"],
-            manager_code=attendance_manager.user_code,
-            created_by_code=attendance_manager.user_code,
-        )
-        db.add(team_lead)
-        team_lead_objects[tl["department"]] = team_lead
-        print(f"✓ Created Team Lead: {team_lead.user_code} ({tl['department']}) (manager: {attendance_manager.user_code})")
-    
-    await db.flush()
+        rows.append({
+            "user_code": tl["user_code"],
+            "email": f"{tl['department'].lower()}.lead@cygnet.com",
+            "hashed_password": team_lead_password,
+            "first_name": tl["first_name"],
+            "last_name": tl["last_name"],
+            "role": UserRole.TEAM_LEAD,
+            "department": tl["department"],
+            "manager_code": attendance_manager_code,
+            "created_by_code": attendance_manager_code,
+        })
+        team_lead_codes[tl["department"]] = tl["user_code"]
+        created.append(f"✓ Created Team Lead: {tl['user_code']} ({tl['department']}) (manager: {attendance_manager_code})")
     
     # 5. Create Employees (under their respective Team Leads)
     employees = [
@@ -181,26 +198,30 @@ async def seed_hierarchy(db: AsyncSession):
     ]
     
     for emp in employees:
-        team_lead = team_lead_objects.get(emp["department"])
-        if not team_lead:
+        team_lead_code = team_lead_codes.get(emp["department"])
+        if not team_lead_code:
             continue
             
-        employee = User(
-            user_code=emp["user_code"],
-            email=f"{emp['first_name'].lower()}.{emp['last_name'].lower()}@cygnet.com",
-            hashed_password=get_password_hash("Employee@123"),
-            first_name=emp["first_name"],
-            last_name=emp["last_name"],
-            role=UserRole.EMPLOYEE,
-            department=emp["department"],
-            team_lead_code=team_lead.user_code,
-            manager_code=attendance_manager.user_code,  # All employees report to attendance manager for attendance
-            created_by_code=attendance_manager.user_code,
-        )
-        db.add(employee)
-        print(f"✓ Created Employee: {employee.user_code} ({emp['department']}) (TL: {team_lead.user_code})")
+        rows.append({
+            "user_code": emp["user_code"],
+            "email": f"{emp['first_name'].lower()}.{emp['last_name'].lower()}@cygnet.com",
+            "hashed_password": employee_password,
+            "first_name": emp["first_name"],
+            "last_name": emp["last_name"],
+            "role": UserRole.EMPLOYEE,
+            "department": emp["department"],
+            "team_lead_code": team_lead_code,
+            "manager_code": attendance_manager_code,  # All employees report to attendance manager for attendance
+            "created_by_code": attendance_manager_code,
+        })
+        created.append(f"✓ Created Employee: {emp['user_code']} ({emp['department']}) (TL: {team_lead_code})")
     
+    # Rows are listed parent-first and the bulk insert keeps that order, so
+    # the created_by/manager/team_lead user_code foreign keys always resolve.
+    await db.execute(insert(User), [{**OPTIONAL_USER_FIELDS, **row} for row in rows])
     await db.commit()
+    for line in created:
+        print(line)
     print("\n" + "="*60)
     print("User hierarchy seeding completed!")
     print("="*60)
@@ -0,0 +1,123 @@
+"""
+Tests for the batch endpoint.
+
+Runs the batch router inside a small app next to a few stub routes, so no
+database or real users are needed.
+"""
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.api.v1.endpoints import batch
+from app.core.config import settings
+from app.core.dependencies import get_current_active_user
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(batch.router, prefix=f"{settings.API_V1_PREFIX}/batch")
+
+    @app.get(f"{settings.API_V1_PREFIX}/ping")
+    async def ping():
+        return {"pong": True}
+
+    @app.post(f"{settings.API_V1_PREFIX}/echo-headers")
+    async def echo_headers(request: Request):
+        return {
+            "host": request.headers.get("host"),
+            "content-length": request.headers.get("content-length"),
+            "transfer-encoding": request.headers.get("transfer-encoding"),
+            "x-custom": request.headers.get("x-custom"),
+        }
+
+    @app.get(f"{settings.API_V1_PREFIX}/boom")
+    async def boom():
+        raise RuntimeError("sub-request failure")
+
+    app.dependency_overrides[get_current_active_user] = lambda: None
+    return app
+
+
+@pytest.fixture
+async def client():
+    transport = ASGITransport(app=_build_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_sub_requests_in_order(client: AsyncClient):
+    """Each sub-request gets its own status and body, in request order"""
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/batch",
+        json={"requests": [
+            {"method": "GET", "path": "/ping"},
+            {"method": "GET", "path": f"{settings.API_V1_PREFIX}/ping"},
+        ]}
+    )
+    assert response.status_code == 200
+    responses = response.json()["data"]["responses"]
+    assert [r["status"] for r in responses] == [200, 200]
+    assert responses[0]["body"] == {"pong": True}
+
+
+@pytest.mark.asyncio
+async def test_batch_records_raising_sub_request_as_500(client: AsyncClient):
+    """A sub-request that raises is reported as 500 and the batch carries on"""
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/batch",
+        json={"requests": [
+            {"method": "GET", "path": "/boom"},
+            {"method": "GET", "path": "/ping"},
+        ]}
+    )
+    assert response.status_code == 200
+    responses = response.json()["data"]["responses"]
+    assert [r["status"] for r in responses] == [500, 200]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", [
+    "/batch",
+    "/batch/",
+    "/./batch",
+    "/%62atch",
+    "/ping/../batch",
+    "/../health",
+    "/%2e%2e/health",
+])
+async def test_batch_rejects_nested_and_escaping_paths(client: AsyncClient, path: str):
+    """Paths are checked after URL resolution, so encoded or dotted tricks are caught"""
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/batch",
+        json={"requests": [{"method": "GET", "path": path}]}
+    )
+    assert response.status_code == 200
+    responses = response.json()["data"]["responses"]
+    assert responses[0]["status"] == 400
+
+
+@pytest.mark.asyncio
+async def test_batch_drops_hop_by_hop_headers(client: AsyncClient):
+    """Client-set Host/framing headers are not forwarded; other headers are"""
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/batch",
+        json={"requests": [{
+            "method": "POST",
+            "path": "/echo-headers",
+            "headers": {
+                "Host": "evil.example",
+                "Content-Length": "9999",
+                "Transfer-Encoding": "chunked",
+                "X-Custom": "kept",
+            },
+            "body": {"value": 1},
+        }]}
+    )
+    assert response.status_code == 200
+    sub = response.json()["data"]["responses"][0]
+    assert sub["status"] == 200
+    assert sub["body"]["host"] == "batch"
+    assert sub["body"]["content-length"] != "9999"
+    assert sub["body"]["transfer-encoding"] is None
+    assert sub["body"]["x-custom"] == "kept"
@@ -0,0 +1,119 @@
+"""
+Tests for parking endpoints.
+"""
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.models.parking import ParkingSlot, ParkingAllocation
+from app.models.enums import ParkingType, ParkingSlotStatus, VehicleType
+
+SLOTS_URL = f"{settings.API_V1_PREFIX}/parking/slots/list"
+MY_SLOT_URL = f"{settings.API_V1_PREFIX}/parking/my-slot"
+EXPORT_URL = f"{settings.API_V1_PREFIX}/parking/logs/export"
+
+
+@pytest.fixture
+async def occupied_slot(db_session, admin_user, employee_user):
+    """One slot with an active allocation for employee_user."""
+    slot = ParkingSlot(
+        slot_code="A-01",
+        slot_label="Parking Slot A-01",
+        parking_type=ParkingType.EMPLOYEE,
+        status=ParkingSlotStatus.OCCUPIED,
+        is_active=True,
+        created_by_code=admin_user.user_code
+    )
+    db_session.add(slot)
+    await db_session.flush()
+    db_session.add(ParkingAllocation(
+        slot_id=slot.id,
+        user_code=employee_user.user_code,
+        parking_type=ParkingType.EMPLOYEE,
+        vehicle_number="KA01AB1234",
+        vehicle_type=VehicleType.CAR,
+        entry_time=datetime.now(timezone.utc),
+        is_active=True
+    ))
+    await db_session.commit()
+    return slot
+
+
+@pytest.mark.asyncio
+async def test_slot_list_returns_304_when_unchanged(
+    client: AsyncClient, occupied_slot, employee_user, auth_headers
+):
+    """Sending back the ETag of an unchanged list gets an empty 304"""
+    headers = auth_headers(employee_user)
+    response = await client.get(SLOTS_URL, headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private"
+
+    response = await client.get(SLOTS_URL, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "private"
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_slot_list_etag_changes_when_occupant_changes(
+    client: AsyncClient, db_session, occupied_slot, employee_user, auth_headers
+):
+    """Renaming the occupant changes the ETag even though the slot row is untouched"""
+    headers = auth_headers(employee_user)
+    response = await client.get(SLOTS_URL, headers=headers)
+    etag = response.headers["ETag"]
+
+    employee_user.first_name = "Renamed"
+    await db_session.commit()
+
+    response = await client.get(SLOTS_URL, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    slot = response.json()["data"]["slots"][0]
+    assert slot["current_occupant"] == f"Renamed {employee_user.last_name}"
+
+
+@pytest.mark.asyncio
+async def test_my_slot_uses_orjson_default_response(
+    client: AsyncClient, occupied_slot, employee_user, auth_headers
+):
+    """Routes returning models are rendered by the ORJSONResponse default"""
+    response = await client.get(MY_SLOT_URL, headers=auth_headers(employee_user))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = orjson.loads(response.content)["data"]
+    assert data["has_active_parking"] is True
+    assert data["slot"]["slot_code"] == "A-01"
+
+
+@pytest.mark.asyncio
+async def test_export_streams_ndjson(
+    client: AsyncClient, occupied_slot, admin_user, employee_user, auth_headers
+):
+    """The export is one JSON log object per line"""
+    async with client.stream("GET", EXPORT_URL, headers=auth_headers(admin_user)) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [line async for line in response.aiter_lines() if line]
+
+    logs = [orjson.loads(line) for line in lines]
+    assert len(logs) == 1
+    assert logs[0]["slot_code"] == "A-01"
+    assert logs[0]["user_name"] == f"{employee_user.first_name} {employee_user.last_name}"
+    assert logs[0]["vehicle_number"] == "KA01AB1234"
+    assert logs[0]["is_active"] is True
+
+
+@pytest.mark.asyncio
+async def test_export_forbidden_for_employee(
+    client: AsyncClient, employee_user, auth_headers
+):
+    """Only parking admins can export the logs"""
+    response = await client.get(EXPORT_URL, headers=auth_headers(employee_user))
+    assert response.status_code == 403
@@ -0,0 +1,99 @@
+"""
+Tests for user management endpoints.
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, func
+
+from app.core.config import settings
+from app.models.user import User
+
+BULK_URL = f"{settings.API_V1_PREFIX}/users/bulk"
+
+
+def _employee(n: int, **fields) -> dict:
+    entry = {
+        "first_name": "Bulk",
+        "last_name": f"User{n}",
+        "email": f"bulk.user{n}@company.com",
+        "password": "Password@123",
+        "role": "EMPLOYEE",
+    }
+    entry.update(fields)
+    return entry
+
+
+async def _user_count(db_session) -> int:
+    return await db_session.scalar(select(func.count(User.id)))
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_returns_every_user(
+    client: AsyncClient, db_session, admin_user, auth_headers
+):
+    """All entries are created and returned in request order"""
+    entries = [_employee(n) for n in range(3)]
+    response = await client.post(BULK_URL, json={"users": entries}, headers=auth_headers(admin_user))
+    assert response.status_code == 200
+    created = response.json()["data"]
+    assert [u["email"] for u in created] == [e["email"] for e in entries]
+    assert all(u["created_by_code"] == admin_user.user_code for u in created)
+    assert await _user_count(db_session) == 1 + len(entries)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rejects_duplicate_email_in_batch(
+    client: AsyncClient, db_session, admin_user, auth_headers
+):
+    """A repeated email inside the batch rejects the whole batch"""
+    entries = [_employee(1), _employee(2), _employee(3, email="bulk.user1@company.com")]
+    response = await client.post(BULK_URL, json={"users": entries}, headers=auth_headers(admin_user))
+    assert response.status_code == 400
+    assert "more than once" in response.json()["detail"]
+    assert await _user_count(db_session) == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rejects_existing_email(
+    client: AsyncClient, db_session, admin_user, employee_user, auth_headers
+):
+    """An email that already exists rejects the whole batch"""
+    entries = [_employee(1), _employee(2, email=employee_user.email)]
+    response = await client.post(BULK_URL, json={"users": entries}, headers=auth_headers(admin_user))
+    assert response.status_code == 400
+    assert "already exists" in response.json()["detail"]
+    assert await _user_count(db_session) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [0, 101])
+async def test_bulk_create_enforces_size_limits(
+    client: AsyncClient, admin_user, auth_headers, size: int
+):
+    """Batches must hold 1-100 entries"""
+    entries = [_employee(n) for n in range(size)]
+    response = await client.post(BULK_URL, json={"users": entries}, headers=auth_headers(admin_user))
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_accepts_100_entries(
+    client: AsyncClient, admin_user, auth_headers
+):
+    """The upper size limit itself is allowed"""
+    entries = [_employee(n) for n in range(100)]
+    response = await client.post(BULK_URL, json={"users": entries}, headers=auth_headers(admin_user))
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == 100
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_forbidden_for_non_admin(
+    client: AsyncClient, db_session, employee_user, auth_headers
+):
+    """Only SUPER_ADMIN and ADMIN may bulk-create users"""
+    response = await client.post(
+        BULK_URL, json={"users": [_employee(1)]}, headers=auth_headers(employee_user)
+    )
+    assert response.status_code == 403
+    assert await _user_count(db_session) == 1